@@ -1,78 +1,61 @@
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib as mpl
+mpl.use("Agg")
+import matplotlib.pyplot as plt
+from csv_util import load_csv
+
+# svg output is slow to write, only do it on request
+SAVE_SVG = "--svg" in sys.argv
+
+fig, ax = plt.subplots()
+
+# histogram with bar heights as fraction of all samples (sums to 1, not a density)
+def hist_fraction(ax, data, bins=10):
+    counts, edges = np.histogram(data, bins=bins)
+    ax.bar(edges[:-1], counts / data.size, width=np.diff(edges), align="edge")
+
+# csv file, whether its first column has to be dropped, plot title, output name
+CONFIGS = [
+    ("data/omp_10Runs.csv", True, "OMP with replacement run variation", "runs_omp_full"),
+    ("data/omp_cheap10Runs.csv", True, "OMP run variation", "runs_omp_cheap"),
+    ("data/10runs.csv", False, "SA run variation", "runs"),
+    ("data/10runs_nofit.csv", False, "SA_no_fit run variation", "runs_nofit"),
+]
+
+def load_runs(path, drop_first):
+    data = load_csv(path)
+    if drop_first:
+        data = data[:,1:]
+    return data
+
+def plot_runs(data, title, name):
+    # violin plot
+    # ax.violinplot(data, showmeans=True)
+    hist_fraction(ax, data)
+
+    # ax.set_xlabel("run")
+    ax.set_title(title)
+    ax.set_xlabel("error")
+    ax.set_ylabel("frequency")
+    # ax.set_yscale("log")
+    fig.savefig(f"{name}.png")
+    if SAVE_SVG:
+        fig.savefig(f"{name}.svg")
+    ax.cla()
+
+runs = {name: load_runs(path, drop_first) for path, drop_first, _, name in CONFIGS}
 
-run_data = np.genfromtxt("data/10runs.csv", delimiter=",")
-run_data_nofit = np.genfromtxt("data/10runs_nofit.csv", delimiter=",")
-
-run_omp_cheap = np.genfromtxt("data/omp_cheap10Runs.csv", delimiter=",")
-# remove first column
-run_omp_cheap = run_omp_cheap[:,1:]
-run_omp = np.genfromtxt("data/omp_10Runs.csv", delimiter=",")
-# remove first column
-run_omp = run_omp[:,1:]
 # standard deviation and mean
-print(f"omp_cheap: mean: {np.mean(run_omp_cheap)}, std: {np.std(run_omp_cheap)}")
-print(f"omp: mean: {np.mean(run_omp)}, std: {np.std(run_omp)}")
-
-# violin plot
-# plt.violinplot(run_omp, showmeans=True)
-plt.hist(run_omp, bins=10, weights=np.zeros_like(run_omp) + 1. / run_omp.size)
-
-# plt.xlabel("run")
-plt.title("OMP with replacement run variation")
-plt.xlabel("error")
-plt.ylabel("frequency")
-# plt.yscale("log")
-plt.savefig("runs_omp_full.png")
-plt.savefig("runs_omp_full.svg")
-plt.clf()
-
-# violin plot
-# plt.violinplot(run_omp_cheap, showmeans=True)
-plt.hist(run_omp_cheap, bins=10, weights=np.zeros_like(run_omp_cheap) + 1. / run_omp_cheap.size)
-# plt.xlabel("run")
-plt.title("OMP run variation")
-plt.xlabel("error")
-plt.ylabel("frequency")
-# plt.yscale("log")
-plt.savefig("runs_omp_cheap.png")
-plt.savefig("runs_omp_cheap.svg")
-plt.clf()
-
-
+print(f"omp_cheap: mean: {np.mean(runs['runs_omp_cheap'])}, std: {np.std(runs['runs_omp_cheap'])}")
+print(f"omp: mean: {np.mean(runs['runs_omp_full'])}, std: {np.std(runs['runs_omp_full'])}")
 
 # standard deviation
-print("std fit", np.std(run_data, axis=0))
-print("std nofit", np.std(run_data_nofit, axis=0))
+print("std fit", np.std(runs["runs"], axis=0))
+print("std nofit", np.std(runs["runs_nofit"], axis=0))
 # average
-print("mean fit", np.mean(run_data, axis=0))
-print("mean nofit", np.mean(run_data_nofit, axis=0))
-
-# violin plot
-# plt.violinplot(run_data, showmeans=True)
-plt.hist(run_data, bins=10, weights=np.zeros_like(run_data) + 1. / run_data.size)
-
-# plt.xlabel("run")
-plt.title("SA run variation")
-plt.xlabel("error")
-plt.ylabel("frequency")
-# plt.yscale("log")
-plt.savefig("runs.png")
-plt.savefig("runs.svg")
-plt.clf()
-
-### no fit
-# violin plot
-# plt.violinplot(run_data_nofit, showmeans=True)
-# histogram
-plt.hist(run_data_nofit, bins=10, weights=np.zeros_like(run_data_nofit) + 1. / run_data_nofit.size)
+print("mean fit", np.mean(runs["runs"], axis=0))
+print("mean nofit", np.mean(runs["runs_nofit"], axis=0))
 
-# plt.xlabel("run")
-plt.title("SA_no_fit run variation")
-plt.xlabel("error")
-plt.ylabel("frequency")
-# plt.yscale("log")
-plt.savefig("runs_nofit.png")
-plt.savefig("runs_nofit.svg")
-plt.clf()
\ No newline at end of file
+for _, _, title, name in CONFIGS:
+    plot_runs(runs[name], title, name)
@@ -1,8 +1,9 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib as mpl
+from csv_util import load_csv
 
-data = np.genfromtxt("data/coating_wl_sweep.csv", delimiter=",")
+data = load_csv("data/coating_wl_sweep.csv")
 # X = fist column
 X = data[:,0]
 # remove first column
@@ -22,7 +23,7 @@ plt.savefig("coating_wl_sweep.svg")
 plt.clf()
 
 
-data = np.genfromtxt("data/coating_angle_sweep.csv", delimiter=",")
+data = load_csv("data/coating_angle_sweep.csv")
 # X = fist column, converted from rad to deg
 X = data[:,0] * 180 / np.pi
 # remove first column
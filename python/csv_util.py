@@ -0,0 +1,16 @@
+import numpy as np
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+def load_csv(path, skiprows=0):
+    if pd is None:
+        # without pandas, np.loadtxt still beats np.genfromtxt on plain float files,
+        # values can differ from the pandas path in the last bit
+        return np.loadtxt(path, delimiter=",", skiprows=skiprows, dtype=np.float64)
+    # pandas' C tokenizer is a lot faster than np.genfromtxt/np.loadtxt
+    data = pd.read_csv(path, header=None, sep=",", skiprows=skiprows, skipinitialspace=True,
+                       dtype=np.float64, engine="c").values
+    # squeeze single columns/rows like np.loadtxt does
+    return data.squeeze()
@@ -1,61 +1,12 @@
+from functools import lru_cache
 import numpy as np
-from itertools import product
+from numpy.polynomial import polynomial as P
 import matplotlib.pyplot as plt
+from numba import njit
 
-class Poly:
+class Poly: # only used to print basis rows
     def __init__(self,coef):
-        if not isinstance(coef,np.ndarray):
-            coef=np.array(coef)
-        self.coef=coef
-
-    def __call__(self, x):
-        if isinstance(x,np.ndarray):
-            return np.sum(self.coef*x[:,np.newaxis]**np.arange(len(self.coef)),axis=1)
-        return np.sum(self.coef*x**np.arange(len(self.coef)))
-
-    def antiDerive(self):
-        return Poly(np.insert(self.coef/np.arange(1, len(self.coef)+1), 0, 0))
-    
-    def __len__(self):
-        return len(self.coef)
-
-    def __iter__(self):
-        return iter(self.coef)
-
-    def __add__(self, b):
-        res=np.zeros(max(len(self),len(b)))
-        res[:len(self)]+=self.coef
-        res[:len(b)]+=b.coef
-        return Poly(res)
-
-    def __sub__(self, b):
-        res=np.zeros(max(len(self),len(b)))
-        res[:len(self)]+=self.coef
-        res[:len(b)]-=b.coef
-        return Poly(res)
-
-    def __mul__(self, b):
-        if isinstance(b, Poly):
-            res=np.zeros(len(self)+len(b)-1)
-            for (i,a),(j,b) in product(enumerate(self),enumerate(b)):
-                res[i+j]+=a*b
-            return Poly(res)
-        else:
-            return Poly(self.coef*b)
-
-    def __and__(self,b): # scalar product
-        f = (self*b).antiDerive()
-        return (f(1)-f(-1))
-
-    def grid(self,b, num_samples): # scalar product
-        sum = 0
-        for i in range(num_samples):
-            # range from -1 to 1 inclusive
-            x = i/(num_samples-1)*2-1
-            # print(i, x)
-            # x = 2*i/num_samples - 1
-            sum += self(x)*b(x)
-        return sum/num_samples*2
+        self.coef=np.asarray(coef, dtype=np.float64)
 
     # def __repr__(self):
     #    return "Poly({})".format(self.coef)
@@ -74,31 +25,80 @@ class Poly:
                     string.append("{}x^{}".format(c,i))
         return " + ".join(string)
 
-def gramSchmidt(basis):
-    for i in range(len(basis)):
-        for j in range(i):
-            basis[i] -= basis[j]*(basis[j]&basis[i])
-        basis[i] *= 1/np.sqrt(basis[i]&basis[i])
+# the basis is stored as one matrix B, row i holding the coefficients of polynomial i
+
+def scalarProduct(a, b): # integral of a*b over [-1, 1]
+    f = P.polyint(P.polymul(a, b))
+    return P.polyval(1, f) - P.polyval(-1, f)
 
-def gramSchmidtGrid(basis, num_samples):
-    for i in range(len(basis)):
+def gramSchmidt(B):
+    for i in range(len(B)):
+        for j in range(i):
+            B[i] -= B[j]*scalarProduct(B[j], B[i])
+        B[i] /= np.sqrt(scalarProduct(B[i], B[i]))
+
+@lru_cache(maxsize=None)
+def vander(num_samples, n): # powers x^0..x^(n-1) of the grid on [-1, 1], shared by everything sampled on it
+    V = np.vander(np.linspace(-1, 1, num_samples), n, increasing=True)
+    V.flags.writeable = False
+    return V
+
+@njit(cache=True, fastmath=True)
+def _vander_dot(V, coef, out): # out = V @ coef
+    for k in range(V.shape[0]):
+        acc = 0.0
+        for c in range(coef.size):
+            acc += V[k, c]*coef[c]
+        out[k] = acc
+
+@njit(cache=True, fastmath=True)
+def _grid_product(a, b): # scalar product of two polys sampled on the same grid
+    acc = 0.0
+    for k in range(a.size):
+        acc += a[k]*b[k]
+    return acc * 2.0 / a.size
+
+@njit(cache=True, fastmath=True)
+def _gram_schmidt_grid(basis_coef, V):
+    # values[i] tracks basis_coef[i] sampled on the grid, so it is updated alongside the coefficients
+    values = np.empty((basis_coef.shape[0], V.shape[0]))
+    for i in range(basis_coef.shape[0]):
+        _vander_dot(V, basis_coef[i], values[i])
         for j in range(i):
-            integrate = basis[j].grid(basis[i], num_samples)
-            basis[i] -= basis[j]*(integrate)
-        integrate = basis[i].grid(basis[i], num_samples)
-        basis[i] *= 1/np.sqrt(integrate)
+            integrate = _grid_product(values[j], values[i])
+            basis_coef[i] -= basis_coef[j]*integrate
+            values[i] -= values[j]*integrate
+        norm = np.sqrt(_grid_product(values[i], values[i]))
+        basis_coef[i] /= norm
+        values[i] /= norm
+
+@njit(cache=True, fastmath=True)
+def _grid_gram(basis_coef, V): # all pairwise grid scalar products
+    values = np.empty((basis_coef.shape[0], V.shape[0]))
+    for i in range(basis_coef.shape[0]):
+        _vander_dot(V, basis_coef[i], values[i])
+    gram = np.empty((basis_coef.shape[0], basis_coef.shape[0]))
+    for i in range(basis_coef.shape[0]):
+        for j in range(basis_coef.shape[0]):
+            gram[i, j] = _grid_product(values[i], values[j])
+    return gram
+
+def gramSchmidtGrid(B, num_samples):
+    _gram_schmidt_grid(B, vander(num_samples, B.shape[1]))
 
 N=5
-LGbasis=[Poly([0]*i+[1]+[0]*(N-i-1)) for i in range(N)]
-print(LGbasis)
+LGbasis=np.eye(N)
+print([Poly(c) for c in LGbasis])
 gramSchmidt(LGbasis)
-print(LGbasis)
+print([Poly(c) for c in LGbasis])
 for i in range(N):
-    print([round(LGbasis[i]&LGbasis[j], 4) for j in range(N)])
+    print([round(scalarProduct(LGbasis[i], LGbasis[j]), 4) for j in range(N)])
 
+# plot grid and its powers, shared by all basis plots
 X=np.linspace(-1,1,1000)
+V=vander(1000, N)
 for i in range(N):
-    plt.plot(X, LGbasis[i](X))
+    plt.plot(X, V @ LGbasis[i])
 
 plt.title(f'legendre polynomials')
 plt.savefig(f'basis/legendre.svg')
@@ -106,17 +106,17 @@ plt.clf()
 
 samples = [5, 10, 100, 1000]
 for num_samples in samples:
-    basis=[Poly([0]*i+[1]+[0]*(N-i-1)) for i in range(N)]
-    print(basis)
+    basis=np.eye(N)
+    print([Poly(c) for c in basis])
     gramSchmidtGrid(basis, num_samples)
-    print(basis)
+    print([Poly(c) for c in basis])
     
+    gram = _grid_gram(basis, vander(num_samples, N))
     for i in range(N):
-        print(f"basis {num_samples}",[round(basis[i].grid(basis[j], num_samples), 4) for j in range(N)])
+        print(f"basis {num_samples}",[round(gram[i, j], 4) for j in range(N)])
 
-    X=np.linspace(-1,1,1000)
     for i in range(N):
-        plt.plot(X, basis[i](X))
+        plt.plot(X, V @ basis[i])
 
     plt.title(f'{num_samples} samples')
     plt.savefig(f'basis/grid{num_samples}.svg')
@@ -125,14 +125,10 @@ for num_samples in samples:
 errors = []
 samples = [100, 200, 250, 400, 500, 700, 1000, 2000, 3500, 5000, 7000, 10000]
 for num_samples in samples:
-    error = 0
+    gram = _grid_gram(LGbasis, vander(num_samples, N))
+    error = np.abs(gram - np.eye(N)).sum()
     for i in range(N):
-        for j in range(N):
-            if i == j:
-                error += abs(LGbasis[i].grid(LGbasis[j], num_samples) - 1)
-            else:
-                error += abs(LGbasis[i].grid(LGbasis[j], num_samples))
-        print(f"basis {num_samples}",[round(basis[i]&basis[j], 4) for j in range(N)])
+        print(f"basis {num_samples}",[round(scalarProduct(basis[i], basis[j]), 4) for j in range(N)])
     errors.append(error)
     print(f"error {num_samples}", error)
 
@@ -155,5 +151,5 @@ plt.savefig(f'basis/legendreErrorLog.svg')
 #types: x: 4d input; i,j,k,l: indices of the basis polynomials
 # total poly: coefficents onto i,j,k,l
 def poly4d(x,i,j,k,l):
-    return LGbasis[i](x[0]) * LGbasis[j](x[1]) * LGbasis[k](x[2]) * LGbasis[l](x[3])
+    return P.polyval(x[0], LGbasis[i]) * P.polyval(x[1], LGbasis[j]) * P.polyval(x[2], LGbasis[k]) * P.polyval(x[3], LGbasis[l])
 # to fit i,j,k,l: scalar product of basis[i,j,k,l] with the function to fit (numerically)
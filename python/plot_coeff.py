@@ -1,5 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from csv_util import load_csv
 # import os
 
 # directory = os.fsencode("./")
@@ -16,7 +17,7 @@ import matplotlib.pyplot as plt
 #         print(plot_name)
 #         plt.savefig(plot_name)
 
-data = np.genfromtxt("data/coefficients sparse.csv", delimiter=",")
+data = load_csv("data/coefficients sparse.csv")
 data = data / data[0]
 
 X = np.linspace(0, len(data), len(data))
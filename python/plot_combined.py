@@ -1,102 +1,100 @@
+from contextlib import ExitStack
+from multiprocessing import Pool
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib as mpl
+mpl.use("Agg")
+import matplotlib.pyplot as plt
+from PIL import Image
+from csv_util import load_csv
+try:
+    from fast_histogram import histogram2d
+except ImportError:
+    histogram2d = None
 
 N=316
 N=190
-def sample(x):
-    return int(np.floor((x+1)/2*N))
-
-def plot_dot(ax, name, picture = 0):
-    data = np.loadtxt(f"dots/dots,{name}.csv", delimiter=",")
-
-    picture1=np.empty((N,N))
-    picture1[:,:]=np.nan
-    picture2=np.empty((N,N))
-    picture2[:,:]=np.nan
-    for row in data:
-        ix=sample(row[0])
-        iy=sample(row[1])
-        picture1[ix,iy]=row[2]
-        picture2[ix,iy]=row[3]
 
+# uniform bins over [-1, 1)^2, samples outside are dropped
+def bin_2d(x, y, weights=None):
+    if histogram2d is None:
+        # np.histogram2d would put x == 1 or y == 1 into the last bin, fast_histogram drops them
+        inside = (x < 1) & (y < 1)
+        if weights is not None:
+            weights = weights[inside]
+        return np.histogram2d(x[inside], y[inside], bins=N, range=[[-1,1],[-1,1]], weights=weights)[0]
+    return histogram2d(x, y, bins=[N,N], range=[[-1,1],[-1,1]], weights=weights)
+
+# average of the values falling into each pixel, NaN where there are none
+def picture_mean(data, values):
+    counts = bin_2d(data[:,0], data[:,1])
+    sums = bin_2d(data[:,0], data[:,1], weights=values)
+    with np.errstate(invalid="ignore"):
+        return np.divide(sums, counts, dtype=np.float32)
+
+def plot_dot(ax, data, picture = 0):
     ax.set_title("data")
-    if picture == 0:
-        img = ax.imshow(picture1, cmap=mpl.cm.gray)#, interpolation='nearest')
-        plt.colorbar(img, ax=ax)
-    else:
-        img = ax.imshow(picture2, cmap=mpl.cm.gray)
-        plt.colorbar(img, ax=ax)
+    img = ax.imshow(picture_mean(data, data[:,2+picture]), cmap=mpl.cm.gray)#, interpolation='nearest')
+    plt.colorbar(img, ax=ax)
 
-def plot_poly_error(ax, name, picture = 0):
-    data = np.loadtxt(f"dots/dots,{name}.csv", delimiter=",")
-    data_poly = np.loadtxt(f"dots/poly,{name},{picture}.csv", delimiter=",")
+def plot_poly_error(ax, data, data_poly, picture = 0):
     # data = data - data_poly
-
-    picture1=np.empty((N,N))
-    picture1[:,:]=np.nan
-    picture2=np.empty((N,N))
-    picture2[:,:]=np.nan
-    for (row, poly) in zip(data, data_poly):
-        ix=sample(row[0])
-        iy=sample(row[1])
-        picture1[ix,iy]=row[2] - poly[2]
-        picture2[ix,iy]=row[3] - poly[2]
-
     ax.set_title("sparse error")
-    if picture == 0:
-        img = ax.imshow(picture1, cmap=mpl.cm.gray)#, interpolation='nearest')
-        plt.colorbar(img, ax=ax)
-    else:
-        img = ax.imshow(picture2, cmap=mpl.cm.gray)
-        plt.colorbar(img, ax=ax)
-
-def plot_poly(ax, name, num = 0):
-    data = np.loadtxt(f"dots/poly,{name},{num}.csv", delimiter=",")
-
-    picture=np.empty((N,N))
-    picture[:,:]=np.nan
-    for row in data:
-        ix=sample(row[0])
-        iy=sample(row[1])
-        picture[ix,iy]=row[2]
+    img = ax.imshow(picture_mean(data, data[:,2+picture] - data_poly[:,2]), cmap=mpl.cm.gray)#, interpolation='nearest')
+    plt.colorbar(img, ax=ax)
 
+def plot_poly(ax, data):
     ax.set_title("sparse poly")
-    img = ax.imshow(picture, cmap=mpl.cm.gray)
+    img = ax.imshow(picture_mean(data, data[:,2]), cmap=mpl.cm.gray)
     plt.colorbar(img, ax=ax)
 
-def plot_de_poly(ax, name, num = 0):
-    data = np.loadtxt(f"dots/depoly,{name},{num}.csv", delimiter=",")
-
-    picture=np.empty((N,N))
-    picture[:,:]=np.nan
-    for row in data:
-        ix=sample(row[0])
-        iy=sample(row[1])
-        picture[ix,iy]=row[2]
-
+def plot_de_poly(ax, data):
     ax.set_title("dense poly")
-    img = ax.imshow(picture, cmap=mpl.cm.gray)
+    img = ax.imshow(picture_mean(data, data[:,2]), cmap=mpl.cm.gray)
     plt.colorbar(img, ax=ax)
 
-def plot_combined(name, num = 0):
+# place images side by side (axis 0) or on top of each other (axis 1), like ImageMagick's +append / -append
+def concat(images, axis):
+    size = [0, 0]
+    size[axis] = sum(i.size[axis] for i in images)
+    size[1-axis] = max(i.size[1-axis] for i in images)
+    canvas = Image.new("RGBA", tuple(size))
+    offset = [0, 0]
+    for i in images:
+        canvas.paste(i, tuple(offset))
+        offset[axis] += i.size[axis]
+    return canvas
+
+# data: the dots of ghost `name`, shared between both axes
+def plot_combined(data, name, num = 0):
+    data_poly = load_csv(f"dots/poly,{name},{num}.csv")
+    data_de_poly = load_csv(f"dots/depoly,{name},{num}.csv")
+
     fig, axs = plt.subplots(2,2)
     fig.suptitle(f"ghost {name} axis {num}")
-    plot_dot(axs[0, 0], name, num)
-    plot_poly(axs[0, 1], name, num)
-    plot_de_poly(axs[1,0], name, num)
-    plot_poly_error(axs[1,1], name, num)
-    plt.tight_layout()
+    plot_dot(axs[0, 0], data, num)
+    plot_poly(axs[0, 1], data_poly)
+    plot_de_poly(axs[1,0], data_de_poly)
+    plot_poly_error(axs[1,1], data, data_poly, num)
+    fig.tight_layout()
     # plt.show()
     fig.savefig(f"dots/combinded,{name},{num}.png")
-
-for i in range(1,6):
-    print(f"plotting ghost {i}")
-    plot_combined(name = i, num = 0)
-    plot_combined(name = i, num = 1)
-
-print("combining images")
-import os
-os.system('convert dots/combinded,*,0.png +append result-sprite0.png')
-os.system('convert dots/combinded,*,1.png +append result-sprite1.png')
-os.system('convert result-sprite0.png result-sprite1.png -append result-sprite.png')
+    plt.close(fig)
+
+# one pool task per ghost, so its dots file is still only loaded once for both axes
+def plot_ghost(name):
+    print(f"plotting ghost {name}")
+    data = load_csv(f"dots/dots,{name}.csv")
+    plot_combined(data, name = name, num = 0)
+    plot_combined(data, name = name, num = 1)
+
+if __name__ == "__main__":
+    with Pool() as pool:
+        list(pool.imap_unordered(plot_ghost, range(1,6)))
+
+    print("combining images")
+    sprites = []
+    for num in (0,1):
+        with ExitStack() as stack:
+            images = [stack.enter_context(Image.open(f"dots/combinded,{i},{num}.png")) for i in range(1,6)]
+            sprites.append(concat(images, axis=0))
+    concat(sprites, axis=1).save("result-sprite.png")
@@ -1,6 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib as mpl
+from csv_util import load_csv
 # import os
 
 # directory = os.fsencode("./")
@@ -18,21 +19,16 @@ import matplotlib as mpl
 #         plt.savefig(plot_name)
 
 # data = np.genfromtxt("dots,2,0.csv", delimiter=",")
-data = np.loadtxt("dots/dots,2,0.csv", delimiter=",", skiprows=1)
+data = load_csv("dots/dots,2,0.csv", skiprows=1)
 data = data[(data[:,0]==0.02941176470588236)&(data[:,1]==0.02941176470588236)]
 print(data.shape)
-def sample(x):
-    return int(np.floor((x+1)/2*N))
 N=17*2
-picture1=np.empty((N,N))
-picture1[:,:]=np.nan
-picture2=np.empty((N,N))
-picture2[:,:]=np.nan
-for row in data:
-    ix=sample(row[2])
-    iy=sample(row[3])
-    picture1[ix,iy]=row[4]
-    picture2[ix,iy]=row[5]
+ix = np.floor((data[:,2]+1)*0.5*N).astype(np.intp)
+iy = np.floor((data[:,3]+1)*0.5*N).astype(np.intp)
+picture1 = np.full((N,N), np.nan, dtype=np.float32)
+picture1[ix, iy] = data[:,4]
+picture2 = np.full((N,N), np.nan, dtype=np.float32)
+picture2[ix, iy] = data[:,5]
 x = data[:,0]
 
 plt.imshow(picture2,cmap=mpl.cm.gray)#, interpolation='nearest')
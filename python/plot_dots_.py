@@ -1,6 +1,8 @@
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib as mpl
+mpl.use("Agg")
+import matplotlib.pyplot as plt
+from csv_util import load_csv
 # import os
 
 # directory = os.fsencode("./")
@@ -17,57 +19,49 @@ import matplotlib as mpl
 #         print(plot_name)
 #         plt.savefig(plot_name)
 N=316
-def sample(x):
-    return int(np.floor((x+1)/2*N))
+fig, ax = plt.subplots()
 
 # data = np.genfromtxt("dots,2,0.csv", delimiter=",")
 def plot_dot(name, picture = 0):
-    data = np.loadtxt(f"dots/dots,{name}.csv", delimiter=",")
+    data = load_csv(f"dots/dots,{name}.csv")
 
-    picture1=np.empty((N,N))
-    picture1[:,:]=np.nan
-    picture2=np.empty((N,N))
-    picture2[:,:]=np.nan
-    for row in data:
-        ix=sample(row[0])
-        iy=sample(row[1])
-        picture1[ix,iy]=row[2]
-        picture2[ix,iy]=row[3]
+    ix = np.floor((data[:,0]+1)*0.5*N).astype(np.intp)
+    iy = np.floor((data[:,1]+1)*0.5*N).astype(np.intp)
+    picture1 = np.full((N,N), np.nan, dtype=np.float32)
+    picture1[ix, iy] = data[:,2]
+    picture2 = np.full((N,N), np.nan, dtype=np.float32)
+    picture2[ix, iy] = data[:,3]
 
     if picture == 0:
-        plt.imshow(picture1, cmap=mpl.cm.gray)#, interpolation='nearest')
+        ax.imshow(picture1, cmap=mpl.cm.gray)#, interpolation='nearest')
     else:
-        plt.imshow(picture2, cmap=mpl.cm.gray)
-    plt.savefig(f"dots/dots,{name},{picture}.png")
-    plt.clf()
+        ax.imshow(picture2, cmap=mpl.cm.gray)
+    fig.savefig(f"dots/dots,{name},{picture}.png")
+    ax.cla()
 
 def plot_poly(name, num = 0):
-    data = np.loadtxt(f"dots/poly,{name},{num}.csv", delimiter=",")
+    data = load_csv(f"dots/poly,{name},{num}.csv")
 
-    picture=np.empty((N,N))
-    picture[:,:]=np.nan
-    for row in data:
-        ix=sample(row[0])
-        iy=sample(row[1])
-        picture[ix,iy]=row[2]
+    ix = np.floor((data[:,0]+1)*0.5*N).astype(np.intp)
+    iy = np.floor((data[:,1]+1)*0.5*N).astype(np.intp)
+    picture = np.full((N,N), np.nan, dtype=np.float32)
+    picture[ix, iy] = data[:,2]
 
-    plt.imshow(picture, cmap=mpl.cm.gray)
-    plt.savefig(f"dots/poly,{name},{num}.png")
-    plt.clf()
+    ax.imshow(picture, cmap=mpl.cm.gray)
+    fig.savefig(f"dots/poly,{name},{num}.png")
+    ax.cla()
 
 def plot_de_poly(name, num = 0):
-    data = np.loadtxt(f"dots/depoly,{name},{num}.csv", delimiter=",")
+    data = load_csv(f"dots/depoly,{name},{num}.csv")
 
-    picture=np.empty((N,N))
-    picture[:,:]=np.nan
-    for row in data:
-        ix=sample(row[0])
-        iy=sample(row[1])
-        picture[ix,iy]=row[2]
+    ix = np.floor((data[:,0]+1)*0.5*N).astype(np.intp)
+    iy = np.floor((data[:,1]+1)*0.5*N).astype(np.intp)
+    picture = np.full((N,N), np.nan, dtype=np.float32)
+    picture[ix, iy] = data[:,2]
 
-    plt.imshow(picture, cmap=mpl.cm.gray)
-    plt.savefig(f"dots/depoly,{name},{num}.png")
-    plt.clf()
+    ax.imshow(picture, cmap=mpl.cm.gray)
+    fig.savefig(f"dots/depoly,{name},{num}.png")
+    ax.cla()
 
 for i in range(1,6):
     plot_dot(i, 0)
@@ -1,8 +1,9 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib as mpl
+from csv_util import load_csv
 
-omp_data = np.genfromtxt("data/omp.csv", delimiter=",")
+omp_data = load_csv("data/omp.csv")
 # remove first column
 omp_data = omp_data[:,1:]
 omp_data = omp_data * omp_data # square
@@ -18,7 +19,7 @@ plt.savefig("omp.png")
 plt.savefig("omp.svg")
 plt.clf()
 
-sa_data = np.genfromtxt("data/sim_ann.csv", delimiter=",")
+sa_data = load_csv("data/sim_ann.csv")
 # remove first column
 sa_data = sa_data[:,1:]
 # exchange column 0 and 1
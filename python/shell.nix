@@ -6,8 +6,12 @@ let
   my-python-packages = python-packages:
     with python-packages; [
       numpy
+      pandas
       scipy
+      numba
       matplotlib
+      fast-histogram
+      pillow
       # other python packages you want
     ];
   python-with-my-packages = pkgs.python3.withPackages my-python-packages;